@@ -6,7 +6,7 @@ import Form from 'antd/lib/form';
 import { PropTypes } from 'prop-types';
 import { WrappedFormUtils } from 'antd/lib/form/Form';
 {% for import_name, path in extra_imports %}
-{% spaceless %}import {{ import_name }} from '{{ path }}';{% endspaceless %}
+import {{ import_name }} from '{{ path }}';
 {% endfor %}
 /* eslint-disable react/jsx-closing-tag-location */
 
@@ -34,20 +34,22 @@ const { {{ sub_import }} } = {{ base }};
       {...itemProps}
       {...formItemLayout}
       label="{{ component.label }}"
-      {% spaceless %}
       colon={false}
-      {% if component.help_text %}help="{{ component.help_text }}"{% endif %}
-      {% endspaceless %}
+      {%- if component.help_text %}
+      help="{{ component.help_text }}"
+      {%- endif %}
     >
       {getFieldDecorator('{{ component.field_name }}', {
         ...fieldOptions,
-        {% spaceless %}
-        {% if component.initial is not None %}initialValue: '{{ component.initial }}',{% endif%}
+        {%- if component.initial is not none %}
+        initialValue: '{{ component.initial }}',
+        {%- endif %}
         rules: [{
           required: {% if component.required %}true{% else %}false{% endif %},
-          {% if component.message is not None %}message: '{{ component.message }}'{% endif %},
+          {%- if component.message is not none %}
+          message: '{{ component.message }}',
+          {%- endif %}
         }],
-        {% endspaceless %}
       })({{ component.input|safe }})}
     </Item>
   );
@@ -71,4 +73,5 @@ const { {{ sub_import }} } = {{ base }};
   fieldOptions: PropTypes.shape({}),
   inputProps: PropTypes.shape({}),
 };
-{% endfor %}{% spaceless %}{% if components|length == 1 %}export default {{ components.0.name }};{% endif %}{% endspaceless %}
+{% endfor %}
+{%- if components|length == 1 %}export default {{ components[0].name }};{% endif %}
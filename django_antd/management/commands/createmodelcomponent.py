@@ -1,17 +1,55 @@
+import functools
 import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 
 from django.conf import settings
-from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage
-from django.core.management import BaseCommand
-from django.forms import fields_for_model
-from django.forms import models, fields
-from django.template import loader
-from django.utils.encoding import force_text
+from django.core.management import BaseCommand, CommandError
+from django.template import engines
 from django.utils.html import escape
 
 
+@functools.lru_cache(maxsize=None)
+def _get_component_template(template_name):
+    """Resolve and compile a component template once per process."""
+    return engines['jinja2'].get_template(template_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_app_module(module_path):
+    """Import an application module once per process, skipping the import machinery on reuse."""
+    return import_module(module_path)
+
+
+FieldRole = namedtuple('FieldRole', ['field_type', 'field_input', 'is_choice'])
+
+FieldContext = namedtuple('FieldContext', [
+    'name', 'field_name', 'initial', 'help_text', 'input',
+    'required', 'message', 'label', 'field',
+])
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_field_role(field_class, is_plain_textarea):
+    """Map a form field class to its render role, walking the MRO once."""
+    if is_plain_textarea:
+        return FieldRole('textarea', 'TextArea', False)
+    for klass in field_class.__mro__:
+        role = Command.FIELD_ROLE.get(klass.__qualname__)
+        if role is not None:
+            return role
+    return FieldRole('text', 'Input', False)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_charfield(field_class):
+    """True when the class descends from django.forms CharField."""
+    return any(klass.__qualname__ == 'CharField' for klass in field_class.__mro__)
+
+
 class Command(BaseCommand):
     """
     Auto-generate model fields as react components using this CLI command script.
@@ -37,18 +75,18 @@ class Command(BaseCommand):
     """
     help = 'Creates an ant-design react component based on models fields.'
 
-    FIELD_MAP = {
-        fields.IntegerField: ('number', 'InputNumber'),
-        fields.DecimalField: ('decimal', 'InputNumber'),
-        models.ModelChoiceField: ('select', 'Select'),
-        models.ModelMultipleChoiceField: ('multi-select', 'Select'),
-        fields.ChoiceField: ('select', 'Select'),
-        fields.TypedChoiceField: ('select', 'Select'),
-        fields.Select: ('select', 'Select'),
-        fields.MultipleChoiceField: ('multi-select', 'Select'),
-        fields.SelectMultiple: ('multi-select', 'Select'),
-        fields.CharField: ('text', 'Input'),
-        fields.BooleanField: ('checkbox', 'Checkbox'),
+    FIELD_ROLE = {
+        'IntegerField': FieldRole('number', 'InputNumber', False),
+        'DecimalField': FieldRole('decimal', 'InputNumber', False),
+        'ModelChoiceField': FieldRole('select', 'Select', True),
+        'ModelMultipleChoiceField': FieldRole('multi-select', 'Select', True),
+        'ChoiceField': FieldRole('select', 'Select', True),
+        'TypedChoiceField': FieldRole('select', 'Select', True),
+        'Select': FieldRole('select', 'Select', True),
+        'MultipleChoiceField': FieldRole('multi-select', 'Select', True),
+        'SelectMultiple': FieldRole('multi-select', 'Select', True),
+        'CharField': FieldRole('text', 'Input', False),
+        'BooleanField': FieldRole('checkbox', 'Checkbox', False),
     }
 
     FIELD_IMPORT_MAP = {
@@ -64,7 +102,8 @@ class Command(BaseCommand):
             help='App label of an application to generate form components.',
         )
         parser.add_argument(
-            '-m', '--model', type=str, required=True, help='Model name.',
+            '-m', '--model', nargs='+', type=str, required=True,
+            help='Model name(s).',
         )
         parser.add_argument(
             '-r', '--replace-existing', action='store_true',
@@ -89,71 +128,67 @@ class Command(BaseCommand):
         )
 
     def _get_model(self, app_label, model_name):
-        return getattr(import_module(f'{app_label}.models'), model_name, None)
-
-    def _get_title_text(self, title):
-        return escape(title)
+        return getattr(_import_app_module(f'{app_label}.models'), model_name, None)
 
-    def _get_input(self, field, field_name, use_placeholder):
-        field_type, field_input = self._get_field_type(field)
+    def _get_input(self, field, role, pretty_name, use_placeholder):
+        field_input = role.field_input
+        parts = [field_input, ' onBlur={onBlur} {...inputProps}']
 
-        field_tag_start = field_input
-        field_tag_start += ' onBlur={onBlur} {...inputProps}'
-
-        if field_type == 'decimal':
-            field_tag_start += ' step={0.1}'
-        elif field_type == 'multi-select':
-            field_tag_start += ' mode="multiple"'
+        if role.field_type == 'decimal':
+            parts.append(' step={0.1}')
+        elif role.field_type == 'multi-select':
+            parts.append(' mode="multiple"')
 
         if use_placeholder:
-            field_tag_start += f' placeholder="Choose the {field_name.replace("_", " ").title()}"'
+            parts.append(f' placeholder="Choose the {pretty_name}"')
 
-        if isinstance(field, models.ChoiceField):
-            if isinstance(field, models.ModelChoiceField) or issubclass(field.__class__, models.ModelChoiceField):
-                choices = [c for c in field.choices]
-            else:
-                choices = field.choices
-            options = "\n".join([
-                f'        <Option value="{value}">{self._get_title_text(title)}</Option>'
-                for value, title in choices
-            ])
-            field_tag_end = f'      </{field_input}>'
-            return f'<{field_tag_start}>\n{options}\n{field_tag_end}'
+        field_tag_start = ''.join(parts)
+
+        if role.is_choice:
+            esc = escape
+            options = "\n".join(
+                f'        <Option value="{value}">{esc(title)}</Option>'
+                for value, title in field.choices
+            )
+            return f'<{field_tag_start}>\n{options}\n      </{field_input}>'
 
         return f'<{field_tag_start} />'
 
     def _get_field_type(self, field):
-        if isinstance(field, fields.CharField) and not field.max_length:
-            return ('textarea', 'TextArea')
-        return self.FIELD_MAP.get(field.__class__, ('text', 'Input'))
+        field_class = field.__class__
+        return _resolve_field_role(
+            field_class,
+            _is_charfield(field_class) and not field.max_length,
+        )
 
-    def get_field_context(self, field_name, field, model_name, use_placeholder):
+    def get_field_context(self, field_name, field, pretty_name, role,
+                          model_name, use_placeholder):
         label = field.label
         initial = field.initial
         required = field.required
-        error_msg = field.error_messages.get(
-            'required', f'Please enter a valid value for: "{label}"',
-        )
+        error_msg = field.error_messages.get('required')
+        if not error_msg:
+            error_msg = f'Please enter a valid value for: "{label}"'
         help_text = field.help_text
 
-        component_name = f'{field_name.replace("_", " ").title().replace(" ", "")}'
+        component_name = pretty_name.replace(' ', '')
         if model_name.lower() not in component_name.lower():
             component_name = f'{model_name}{component_name}'
 
-        return {
-            'name': component_name,
-            'field_name': field_name,
-            'initial': initial,
-            'help_text': help_text,
-            'input': self._get_input(field, field_name, use_placeholder),
-            'required': required,
-            'message': error_msg,
-            'label': label,
-            'field': field,
-        }
+        return FieldContext(
+            name=component_name,
+            field_name=field_name,
+            initial=initial,
+            help_text=help_text,
+            input=self._get_input(field, role, pretty_name, use_placeholder),
+            required=required,
+            message=error_msg,
+            label=label,
+            field=field,
+        )
 
     def _get_form(self, app_label, form_class):
-        return getattr(import_module(f'{app_label}.forms'), form_class, None)
+        return getattr(_import_app_module(f'{app_label}.forms'), form_class, None)
 
     @staticmethod
     def _get_location(options, verbose_name, model_name):
@@ -162,21 +197,20 @@ class Command(BaseCommand):
 
         return output_path, file_name
 
-    def get_import(self, field):
-        field_type, field_input = self._get_field_type(field)
-
-        if field_input in self.FIELD_IMPORT_MAP.keys():
-            return self.FIELD_IMPORT_MAP.get(field_input)
-
-    def get_sub_imports(self, field):
-        field_type, field_input = self._get_field_type(field)
+    def _resolve_imports(self, field_type, field_input):
+        field_import = self.FIELD_IMPORT_MAP.get(field_input)
 
+        sub_import = None
         if field_type in ['select', 'multi-select']:
-            return ('Option', 'Select')
+            sub_import = ('Option', 'Select')
         elif field_type in ['textarea']:
-            return ('TextArea', 'Input')
+            sub_import = ('TextArea', 'Input')
+
+        return field_import, sub_import
 
     def _get_context(self, model, model_name, excluded_fields, use_placeholder):
+        from django.forms import fields_for_model
+
         ant_field_labels = getattr(model, '_ANT_MODEL_FIELD_LABELS', {})
         components = []
         imports = set()
@@ -190,9 +224,12 @@ class Command(BaseCommand):
         )
 
         for f_name, field in model_fields.items():
-            components.append(self.get_field_context(f_name, field, model_name, use_placeholder))
-            field_import = self.get_import(field)
-            sub_import = self.get_sub_imports(field)
+            pretty_name = f_name.replace('_', ' ').title()
+            role = self._get_field_type(field)
+            components.append(self.get_field_context(
+                f_name, field, pretty_name, role, model_name, use_placeholder,
+            ))
+            field_import, sub_import = self._resolve_imports(role.field_type, role.field_input)
             if sub_import:
                 sub_imports.add(sub_import)
             if field_import:
@@ -205,41 +242,61 @@ class Command(BaseCommand):
         }
 
     def _render_js(self, fs, file_name, context):
-        content = loader.render_to_string('django_antd/components/model-component.tpl', context=context)
-        return fs.save(file_name, ContentFile(content))
+        template = _get_component_template('django_antd/components/model-component.tpl')
+        file_name = fs.get_available_name(file_name)
+        with open(fs.path(file_name), 'w', encoding='utf-8', buffering=65536) as output:
+            template.template.stream(context).dump(output)
+        return file_name
 
-    def handle(self, *args, **options):
-        app_label = options['app_label']
-        model = options['model']
+    def _process_model(self, app_label, model, options):
         excluded_fields = options['excluded_fields']
         replace_existing = options['replace_existing']
         use_placeholder = options['use_placeholder']
 
         model_class = self._get_model(app_label, model)
-        verbose_name = force_text(model_class._meta.verbose_name)
+        if model_class is None:
+            raise CommandError(f'Model "{model}" could not be found in "{app_label}.models".')
+        verbose_name = str(model_class._meta.verbose_name)
         output_path, file_name = self._get_location(options, verbose_name, model)
 
-        if not os.path.exists(output_path):
-            os.makedirs(output_path, exist_ok=True)
+        os.makedirs(output_path, exist_ok=True)
 
         fs = FileSystemStorage(location=output_path)
         if fs.exists(file_name):
             if replace_existing:
                 fs.delete(file_name)
             else:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f'File "{file_name}" already exists a new component file will be created.',
-                    ),
-                )
+                with self._stdout_lock:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f'File "{file_name}" already exists a new component file will be created.',
+                        ),
+                    )
 
         output = self._render_js(
             fs,
             file_name,
             self._get_context(model_class, model, excluded_fields, use_placeholder),
         )
-        self.stdout.write(
-            self.style.SUCCESS(
-                f'Successfully created component file "{output}": \n{fs.path(output)}',
-            ),
-        )
+        with self._stdout_lock:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Successfully created component file "{output}": \n{fs.path(output)}',
+                ),
+            )
+
+    def handle(self, *args, **options):
+        app_label = options['app_label']
+        models = options['model']
+        self._stdout_lock = threading.Lock()
+
+        if len(models) == 1:
+            self._process_model(app_label, models[0], options)
+            return
+
+        max_workers = min(len(models), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(
+                lambda model: self._process_model(app_label, model, options),
+                models,
+            ))
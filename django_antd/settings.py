@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/2.0/ref/settings/
 
 import os
 
+import jinja2
+
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -66,6 +68,20 @@ TEMPLATES = [
             ],
         },
     },
+    {
+        'BACKEND': 'django.template.backends.jinja2.Jinja2',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            # Compiled templates are reused across repeated command
+            # invocations instead of being re-parsed on every run. The
+            # default cache directory is per-user (uid-suffixed, 0700 and
+            # ownership-checked) so other local users cannot plant
+            # marshalled bytecode in it.
+            'auto_reload': False,
+            'bytecode_cache': jinja2.FileSystemBytecodeCache(),
+        },
+    },
 ]
 
 WSGI_APPLICATION = 'django_antd.wsgi.application'